@@ -3,15 +3,19 @@ ppt_utils.py — 비시각적 유틸리티
 디자인을 제약하는 코드 없음. 인프라 헬퍼만 포함.
 """
 
+import datetime
+import functools
+import io
 import os
 import shutil
 import subprocess
 import platform
+import re
 from pathlib import Path
 
 from lxml import etree
 from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
+from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
@@ -36,69 +40,126 @@ CONTENT_SAFE = _SafeZone(
     bottom=Inches(7.02),
 )
 
+# 헬퍼 내부에서 반복 사용하는 텍스트 색상 (호출마다 새로 만들지 않음)
+_WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+_DARK_TEXT = RGBColor(0x33, 0x33, 0x33)
 
+
+def _font_dest_dir():
+    """플랫폼별 사용자 폰트 디렉토리. 지원하지 않는 플랫폼이면 None."""
+    system = platform.system()
+    if system == "Linux":
+        return Path.home() / ".local" / "share" / "fonts"
+    if system == "Darwin":
+        return Path.home() / "Library" / "Fonts"
+    if system == "Windows":
+        return Path(os.environ.get("LOCALAPPDATA", "")) / "Microsoft" / "Windows" / "Fonts"
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def ensure_fonts():
-    """ref/fonts/ 의 .ttf 폰트를 시스템에 설치한다. 이미 설치됐으면 스킵."""
-    if not FONTS_DIR.exists():
-        return False
+    """ref/fonts/ 의 .ttf 폰트를 시스템에 설치한다. 이미 설치됐으면 스킵.
 
-    font_files = list(FONTS_DIR.glob("*.ttf"))
+    설치 디렉토리를 한 번만 scandir 해서 파일명 집합으로 설치 여부를 확인하고,
+    모두 있으면 바로 끝낸다. 한 프로세스 안에서는 한 번만 실행된다.
+    fc-cache 는 백그라운드로 띄우고 기다리지 않는다.
+    """
+    try:
+        font_files = [e for e in os.scandir(FONTS_DIR) if e.name.endswith(".ttf")]
+    except FileNotFoundError:
+        return False
     if not font_files:
         return False
 
-    system = platform.system()
-
-    if system == "Linux":
-        dest_dir = Path.home() / ".local" / "share" / "fonts"
-    elif system == "Darwin":
-        dest_dir = Path.home() / "Library" / "Fonts"
-    elif system == "Windows":
-        dest_dir = Path(os.environ.get("LOCALAPPDATA", "")) / "Microsoft" / "Windows" / "Fonts"
-    else:
+    dest_dir = _font_dest_dir()
+    if dest_dir is None:
         return False
 
     dest_dir.mkdir(parents=True, exist_ok=True)
+    existing = {e.name for e in os.scandir(dest_dir)}
+    if {f.name for f in font_files} <= existing:
+        return True
+
     installed = False
 
     for f in font_files:
-        dest = dest_dir / f.name
-        if not dest.exists():
-            shutil.copy2(f, dest)
+        if f.name not in existing:
+            shutil.copy2(f.path, dest_dir / f.name)
             installed = True
 
-    if installed and system == "Linux":
+    if installed and platform.system() == "Linux":
         try:
-            subprocess.run(["fc-cache", "-fv"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            subprocess.Popen(["fc-cache", "-f"],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
             pass
 
     return True
 
 
+@functools.lru_cache(maxsize=4)
+def _read_template(path):
+    """템플릿 파일 바이트 (프로세스당 한 번만 디스크에서 읽음)."""
+    return Path(path).read_bytes()
+
+
 def load_template(page_numbers=True):
     """표지.pptx를 로드하고 샘플 슬라이드를 제거하여 빈 Presentation을 반환한다."""
-    prs = Presentation(str(DEFAULT_TEMPLATE))
-
-    # 샘플 슬라이드 제거
-    slide_ids = [slide.slide_id for slide in prs.slides]
-    for sid in slide_ids:
-        idx = next(
-            (i for i, s in enumerate(prs.slides._sldIdLst) if s.id == sid), -1
-        )
-        if idx >= 0:
-            rId = prs.slides._sldIdLst[idx].rId
-            prs.part.drop_rel(rId)
-            del prs.slides._sldIdLst[idx]
+    prs = Presentation(io.BytesIO(_read_template(DEFAULT_TEMPLATE)))
+
+    # 샘플 슬라이드 제거 (sldIdLst 한 번 순회)
+    sldIdLst = prs.slides._sldIdLst
+    for sldId in list(sldIdLst):
+        prs.part.drop_rel(sldId.rId)
+        sldIdLst.remove(sldId)
 
     return prs
 
 
 def get_layout(prs, name):
-    """이름으로 슬라이드 레이아웃을 찾는다. 없으면 ValueError."""
-    for layout in prs.slide_masters[0].slide_layouts:
-        if layout.name == name:
-            return layout
-    raise ValueError(f"레이아웃 '{name}'을 찾을 수 없습니다.")
+    """이름으로 슬라이드 레이아웃을 찾는다. 없으면 ValueError.
+
+    이름→레이아웃 사전을 프레젠테이션 파트에 붙여 두므로 반복 호출은 사전 조회 한 번이고,
+    캐시는 프레젠테이션과 함께 해제된다.
+    """
+    layouts = getattr(prs.part, "_ppt_utils_layouts", None)
+    if layouts is None or name not in layouts:
+        layouts = {}
+        for layout in prs.slide_masters[0].slide_layouts:
+            layouts.setdefault(layout.name, layout)
+        prs.part._ppt_utils_layouts = layouts
+    try:
+        return layouts[name]
+    except KeyError:
+        raise ValueError(f"레이아웃 '{name}'을 찾을 수 없습니다.") from None
+
+
+_GHOST_TEXTS = (
+    "마스터 텍스트 스타일 편집",
+    "마스터 텍스트 스타일을 편집합니다",
+    "마스터 제목 스타일 편집",
+    "제목을 추가하려면 클릭하십시오",
+    "제목을 입력하십시오",
+    "부제목을 입력하십시오",
+    "텍스트를 입력하십시오",
+    "내용을 입력하십시오",
+    "텍스트를 추가하려면 클릭하십시오",
+    "Click to edit Master text styles",
+    "Click to edit Master title style",
+    "Click to add title",
+    "Click to add text",
+    "Click to add subtitle",
+)
+# "유령 문구가 text 안에 있음" 은 정규식 한 번, "text 가 유령 문구의 일부" 는
+# 구분자로 이어 붙인 문자열 한 번의 검색으로 판정한다.
+_GHOST_RE = re.compile("|".join(map(re.escape, _GHOST_TEXTS)))
+_GHOST_JOINED = "\0".join(_GHOST_TEXTS)
+
+
+def _is_ghost_text(text):
+    """빈 문자열이거나 유령 문구와 겹치면 True."""
+    return text in _GHOST_JOINED or _GHOST_RE.search(text) is not None
 
 
 def clear_placeholders(slide, keep=None):
@@ -106,48 +167,40 @@ def clear_placeholders(slide, keep=None):
 
     Args:
         slide: 슬라이드 객체
-        keep: 유지할 플레이스홀더 idx 리스트
+        keep: 유지할 플레이스홀더 idx 리스트 (텍스트 내용과 무관하게 유지)
     """
-    if keep is None:
-        keep = []
-
-    ghost_texts = [
-        "마스터 텍스트 스타일 편집",
-        "마스터 텍스트 스타일을 편집합니다",
-        "마스터 제목 스타일 편집",
-        "제목을 추가하려면 클릭하십시오",
-        "제목을 입력하십시오",
-        "부제목을 입력하십시오",
-        "텍스트를 입력하십시오",
-        "내용을 입력하십시오",
-        "텍스트를 추가하려면 클릭하십시오",
-        "Click to edit Master text styles",
-        "Click to edit Master title style",
-        "Click to add title",
-        "Click to add text",
-        "Click to add subtitle",
-    ]
+    keep = set(keep or ())
 
     to_remove = []
-
-    for ph in list(slide.placeholders):
-        if ph.placeholder_format.idx in keep:
-            continue
-        if ph.has_text_frame:
-            text = ph.text_frame.text.strip().rstrip(".")
-            if not text or any(g in text or text in g for g in ghost_texts):
-                to_remove.append(ph)
-
     for shape in slide.shapes:
-        if shape in to_remove:
+        if shape.is_placeholder and shape.placeholder_format.idx in keep:
             continue
         if shape.has_text_frame:
             text = shape.text_frame.text.strip().rstrip(".")
-            if any(g in text or text in g for g in ghost_texts):
-                to_remove.append(shape)
+            if _is_ghost_text(text):
+                to_remove.append(shape._element)
+
+    # slide.shapes 의 요소는 모두 spTree 직계 자식 — 부모를 한 번만 구한다
+    spTree = slide.shapes._spTree
+    for element in to_remove:
+        spTree.remove(element)
 
-    for shape in to_remove:
-        shape._element.getparent().remove(shape._element)
+
+def _apply_font(run, name=None, size=None, color=None, bold=None):
+    """run 서식을 한 번에 적용한다. None 인 항목은 건드리지 않는다 (상속 유지).
+
+    run.font 는 접근할 때마다 rPr 를 찾아 새 Font 프록시를 만들므로 한 번만 가져온다.
+    size 는 이미 변환된 길이 값 (Pt(...)).
+    """
+    font = run.font
+    if size is not None:
+        font.size = size
+    if bold is not None:
+        font.bold = bold
+    if name is not None:
+        font.name = name
+    if color is not None:
+        font.color.rgb = color
 
 
 def set_title(slide, text, font_name=None, font_size=None, color=None, bold=None):
@@ -157,16 +210,10 @@ def set_title(slide, text, font_name=None, font_size=None, color=None, bold=None
     """
     ph = slide.placeholders[0]
     ph.text = text
-    if font_name is not None or font_size is not None or color is not None or bold is not None:
+    size = Pt(font_size) if font_size is not None else None
+    if font_name is not None or size is not None or color is not None or bold is not None:
         for run in ph.text_frame.paragraphs[0].runs:
-            if font_name is not None:
-                run.font.name = font_name
-            if font_size is not None:
-                run.font.size = Pt(font_size)
-            if color is not None:
-                run.font.color.rgb = color
-            if bold is not None:
-                run.font.bold = bold
+            _apply_font(run, font_name, size, color, bold)
     return ph
 
 
@@ -177,46 +224,62 @@ def set_cell_anchor(cell, anchor="ctr"):
         cell: python-pptx 테이블 셀
         anchor: 't' (위), 'ctr' (가운데), 'b' (아래)
     """
-    from lxml import etree
-
-    a_ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
-    tc = cell._tc
-
-    # tcPr 에 anchor 설정
-    tcPr = next((c for c in tc if "tcPr" in c.tag), None)
-    if tcPr is None:
-        tcPr = etree.Element(f"{a_ns}tcPr")
-        tc.insert(0, tcPr)
-    tcPr.set("anchor", anchor)
-
-    # txBody > bodyPr 에도 anchor 설정
-    txBody = next((c for c in tc if "txBody" in c.tag), None)
-    if txBody is None:
-        _ = cell.text_frame  # txBody 생성
-        txBody = next((c for c in tc if "txBody" in c.tag), None)
-
-    if txBody is not None:
-        bodyPr = next((c for c in txBody if "bodyPr" in c.tag), None)
-        if bodyPr is None:
-            bodyPr = etree.Element(f"{a_ns}bodyPr")
-            txBody.insert(0, bodyPr)
-        bodyPr.set("anchor", anchor)
+    # tcPr 에 anchor 설정 (없으면 스키마 순서대로 txBody 뒤에 생성)
+    cell._tc.get_or_add_tcPr().set("anchor", anchor)
+
+    # txBody > bodyPr 에도 anchor 설정 (text_frame 접근 시 txBody 생성)
+    cell.text_frame._txBody.bodyPr.set("anchor", anchor)
+
+
+_TAILEND = qn("a:tailEnd")
+_TAILEND_ATTRS = {"type": "triangle", "w": "med", "len": "med"}
 
 
 def add_arrowhead(connector):
-    """커넥터에 화살표 머리를 추가한다 (python-pptx에 네이티브 API 없음)."""
-    connector.line._ln.append(
-        connector.line._ln.makeelement(
-            qn("a:tailEnd"),
-            {"type": "triangle", "w": "med", "len": "med"},
-        )
-    )
+    """커넥터에 화살표 머리를 추가한다 (python-pptx에 네이티브 API 없음).
+
+    a:ln 이 없으면 만들고, 이미 tailEnd 가 있으면 교체한다.
+    """
+    ln = connector.line._get_or_add_ln()
+    old = ln.find(_TAILEND)
+    if old is not None:
+        ln.remove(old)
+    etree.SubElement(ln, _TAILEND, _TAILEND_ATTRS)
 
 
 # ---------------------------------------------------------------------------
 # 신규 유틸리티 — XML 배관 코드 캡슐화 (시각적 의견 없음)
 # ---------------------------------------------------------------------------
 
+# 자주 쓰는 태그의 Clark 표기 — 호출마다 qn() 을 다시 풀지 않도록 미리 계산
+_SPPR = qn("p:spPr")
+_OUTER_SHDW = qn("a:outerShdw")
+_SRGB_CLR = qn("a:srgbClr")
+_SCHEME_CLR = qn("a:schemeClr")
+_ALPHA = qn("a:alpha")
+_SOLID_FILL = qn("a:solidFill")
+_GRAD_FILL = qn("a:gradFill")
+_GS_LST = qn("a:gsLst")
+_GS = qn("a:gs")
+_BODY_PR = qn("a:bodyPr")
+
+
+def _get_spPr(shape):
+    """도형의 spPr 요소. 없으면 None.
+
+    hasattr + 속성 접근은 spPr 를 두 번 찾으므로 getattr 한 번으로 처리한다.
+    """
+    element = shape._element
+    spPr = getattr(element, "spPr", None)
+    if spPr is None:
+        spPr = element.find(_SPPR)
+    return spPr
+
+
+def _hex_rgb(r, g, b):
+    """0-255 정수 3개 → 'RRGGBB' (범위 밖이면 ValueError)."""
+    return bytes((r, g, b)).hex().upper()
+
 
 def add_shadow(shape, blur_pt=4, dist_pt=3, direction=2700000,
                opacity_pct=40, color=None):
@@ -230,42 +293,31 @@ def add_shadow(shape, blur_pt=4, dist_pt=3, direction=2700000,
         opacity_pct: 그림자 불투명도 (0-100)
         color: RGBColor 또는 (r,g,b) 튜플. None이면 검정
     """
-    if color is None:
-        r, g, b = 0, 0, 0
-    elif isinstance(color, RGBColor):
-        r, g, b = color[0], color[1], color[2]
-    else:
-        r, g, b = color
+    hex_color = "000000" if color is None else _hex_rgb(*color)
 
     alpha_val = int(opacity_pct * 1000)  # 40% → 40000
     blur_emu = str(Pt(blur_pt))
     dist_emu = str(Pt(dist_pt))
-    hex_color = f"{r:02X}{g:02X}{b:02X}"
 
-    spPr = shape._element.spPr if hasattr(shape._element, 'spPr') else None
-    if spPr is None:
-        spPr = shape._element.find(qn("p:spPr"))
+    spPr = _get_spPr(shape)
     if spPr is None:
         return
 
-    # effectLst 찾기/생성
-    effectLst = spPr.find(qn("a:effectLst"))
-    if effectLst is None:
-        effectLst = spPr.makeelement(qn("a:effectLst"), {})
-        spPr.append(effectLst)
+    # effectLst 찾기/생성 (스키마 순서에 맞는 위치에 삽입됨)
+    effectLst = spPr.get_or_add_effectLst()
 
     # 기존 outerShdw 제거
-    for old in effectLst.findall(qn("a:outerShdw")):
+    for old in effectLst.findall(_OUTER_SHDW):
         effectLst.remove(old)
 
-    outerShdw = effectLst.makeelement(qn("a:outerShdw"), {
+    outerShdw = effectLst.makeelement(_OUTER_SHDW, {
         "blurRad": blur_emu,
         "dist": dist_emu,
         "dir": str(direction),
         "rotWithShape": "0",
     })
-    srgbClr = outerShdw.makeelement(qn("a:srgbClr"), {"val": hex_color})
-    alphaElem = srgbClr.makeelement(qn("a:alpha"), {"val": str(alpha_val)})
+    srgbClr = outerShdw.makeelement(_SRGB_CLR, {"val": hex_color})
+    alphaElem = srgbClr.makeelement(_ALPHA, {"val": str(alpha_val)})
     srgbClr.append(alphaElem)
     outerShdw.append(srgbClr)
     effectLst.append(outerShdw)
@@ -280,27 +332,25 @@ def set_shape_opacity(shape, opacity_pct):
     """
     alpha_val = str(int(opacity_pct * 1000))  # 50% → 50000
 
-    spPr = shape._element.spPr if hasattr(shape._element, 'spPr') else None
-    if spPr is None:
-        spPr = shape._element.find(qn("p:spPr"))
+    spPr = _get_spPr(shape)
     if spPr is None:
         return
 
-    solidFill = spPr.find(qn("a:solidFill"))
+    solidFill = spPr.find(_SOLID_FILL)
     if solidFill is None:
         return
 
     # srgbClr 또는 schemeClr 찾기
-    color_elem = solidFill.find(qn("a:srgbClr"))
+    color_elem = solidFill.find(_SRGB_CLR)
     if color_elem is None:
-        color_elem = solidFill.find(qn("a:schemeClr"))
+        color_elem = solidFill.find(_SCHEME_CLR)
     if color_elem is None:
         return
 
     # 기존 alpha 제거 후 새로 추가
-    for old in color_elem.findall(qn("a:alpha")):
+    for old in color_elem.findall(_ALPHA):
         color_elem.remove(old)
-    alpha_elem = color_elem.makeelement(qn("a:alpha"), {"val": alpha_val})
+    alpha_elem = color_elem.makeelement(_ALPHA, {"val": alpha_val})
     color_elem.append(alpha_elem)
 
 
@@ -315,26 +365,24 @@ def add_gradient_stop(shape, position, r, g, b):
         position: 0.0~1.0 (0=시작, 1=끝)
         r, g, b: 정수 0-255
     """
-    spPr = shape._element.spPr if hasattr(shape._element, 'spPr') else None
-    if spPr is None:
-        spPr = shape._element.find(qn("p:spPr"))
+    spPr = _get_spPr(shape)
     if spPr is None:
         return
 
-    gradFill = spPr.find(qn("a:gradFill"))
+    gradFill = spPr.find(_GRAD_FILL)
     if gradFill is None:
         return
 
-    gsLst = gradFill.find(qn("a:gsLst"))
+    gsLst = gradFill.find(_GS_LST)
     if gsLst is None:
-        gsLst = gradFill.makeelement(qn("a:gsLst"), {})
+        gsLst = gradFill.makeelement(_GS_LST, {})
         gradFill.insert(0, gsLst)
 
     pos_val = str(int(position * 100000))  # 0.5 → 50000
-    hex_color = f"{r:02X}{g:02X}{b:02X}"
+    hex_color = _hex_rgb(r, g, b)
 
-    gs = gsLst.makeelement(qn("a:gs"), {"pos": pos_val})
-    srgbClr = gs.makeelement(qn("a:srgbClr"), {"val": hex_color})
+    gs = gsLst.makeelement(_GS, {"pos": pos_val})
+    srgbClr = gs.makeelement(_SRGB_CLR, {"val": hex_color})
     gs.append(srgbClr)
     gsLst.append(gs)
 
@@ -368,22 +416,13 @@ def make_icon_circle(slide, x, y, size, fill_color, text="",
         tf.word_wrap = True
         p = tf.paragraphs[0]
         p.alignment = PP_ALIGN.CENTER
-        run = p.add_run()
-        run.text = str(text)
-        run.font.size = Pt(font_size)
-        run.font.bold = True
-
         if font_color is None:
-            is_bright = brightness_check(fill_color[0], fill_color[1], fill_color[2])
-            run.font.color.rgb = RGBColor(0x33, 0x33, 0x33) if is_bright else RGBColor(0xFF, 0xFF, 0xFF)
-        else:
-            run.font.color.rgb = font_color
+            is_bright = brightness_check(*fill_color)
+            font_color = _DARK_TEXT if is_bright else _WHITE
+        _add_run(p, text, None, font_size, font_color, True)
 
-        # 세로 중앙정렬
-        tf_body = shape.text_frame._txBody
-        bodyPr = tf_body.find(qn("a:bodyPr"))
-        if bodyPr is not None:
-            bodyPr.set("anchor", "ctr")
+        # 세로 중앙정렬 (위에서 가져온 text_frame 재사용)
+        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
 
     return shape
 
@@ -398,7 +437,8 @@ def brightness_check(r, g, b):
         True = 밝은 배경 (어두운 텍스트 사용)
         False = 어두운 배경 (흰색 텍스트 사용)
     """
-    return (r * 0.299 + g * 0.587 + b * 0.114) > 160
+    # BT.601 휘도 가중치를 1000배한 정수 연산 (부동소수 오차 없음)
+    return (r * 299 + g * 587 + b * 114) > 160000
 
 
 # ---------------------------------------------------------------------------
@@ -406,6 +446,14 @@ def brightness_check(r, g, b):
 # ---------------------------------------------------------------------------
 
 
+def _add_run(p, text, font_name, font_size, color, bold):
+    """단락에 서식이 적용된 run 하나를 추가한다 (add_textbox/add_para 공용)."""
+    run = p.add_run()
+    run.text = str(text)
+    _apply_font(run, font_name or None, Pt(font_size), color or None, bold)
+    return run
+
+
 def add_textbox(slide, x, y, w, h, text, font_name=None, font_size=12,
                 color=None, bold=False, align=PP_ALIGN.LEFT, word_wrap=True):
     """텍스트박스를 추가하고 단일 단락을 설정한다.
@@ -430,14 +478,7 @@ def add_textbox(slide, x, y, w, h, text, font_name=None, font_size=12,
 
     p = tf.paragraphs[0]
     p.alignment = align
-    run = p.add_run()
-    run.text = str(text)
-    run.font.size = Pt(font_size)
-    run.font.bold = bold
-    if font_name:
-        run.font.name = font_name
-    if color:
-        run.font.color.rgb = color
+    _add_run(p, text, font_name, font_size, color, bold)
 
     return txBox
 
@@ -468,14 +509,7 @@ def add_para(text_frame, text, font_name=None, font_size=12, color=None,
     if space_after is not None:
         p.space_after = space_after
 
-    run = p.add_run()
-    run.text = str(text)
-    run.font.size = Pt(font_size)
-    run.font.bold = bold
-    if font_name:
-        run.font.name = font_name
-    if color:
-        run.font.color.rgb = color
+    _add_run(p, text, font_name, font_size, color, bold)
 
     return p
 
@@ -491,11 +525,20 @@ def set_body_anchor(shape, anchor="ctr"):
     """
     if not shape.has_text_frame:
         return
-    bodyPr = shape.text_frame._txBody.find(qn("a:bodyPr"))
+    bodyPr = shape.text_frame._txBody.find(_BODY_PR)
     if bodyPr is not None:
         bodyPr.set("anchor", anchor)
 
 
+_COVER_PURPOSES = ("의사결정", "보고", "정보공유")
+
+# 표지 텍스트박스 위치/크기 (x, y, w, h) — 모듈 로드 시 한 번만 EMU 변환
+_Box = namedtuple("_Box", ["x", "y", "w", "h"])
+_COVER_PURPOSE_BOX = _Box(Inches(6.5), Inches(0.25), Inches(4.0), Inches(0.35))
+_COVER_DATE_BOX = _Box(Inches(3.0), Inches(3.0), Inches(4.83), Inches(0.4))
+_COVER_AUTHOR_BOX = _Box(Inches(2.0), Inches(5.8), Inches(6.83), Inches(0.4))
+
+
 def setup_cover(slide, title, purpose="정보공유", author="강민규 선임",
                 department="미래융합설계센터 알고리즘개발팀",
                 date=None, font_name=None, title_font_size=28,
@@ -507,47 +550,40 @@ def setup_cover(slide, title, purpose="정보공유", author="강민규 선임",
     - 중간: 날짜
     - 하단 중앙: 부서명 + 이름
     """
-    from datetime import date as date_cls
-
     if date is None:
-        date = date_cls.today().strftime("%Y.%m.%d")
+        date = datetime.date.today().strftime("%Y.%m.%d")
     if title_color is None:
-        title_color = RGBColor(0xFF, 0xFF, 0xFF)
+        title_color = _WHITE
+
+    # 플레이스홀더는 한 번만 순회해 idx → 도형 사전으로 사용
+    phs = {ph.placeholder_format.idx: ph for ph in slide.placeholders}
 
     # PH idx=1 (부제목) 제거
-    for ph in list(slide.placeholders):
-        if ph.placeholder_format.idx == 1:
-            ph._element.getparent().remove(ph._element)
-            break
+    subtitle = phs.get(1)
+    if subtitle is not None:
+        subtitle._element.getparent().remove(subtitle._element)
 
     # 제목 (PH idx=0)
-    ph0 = slide.placeholders[0]
+    ph0 = phs[0]
     ph0.text = title
+    title_size = Pt(title_font_size)
     for run in ph0.text_frame.paragraphs[0].runs:
-        run.font.size = Pt(title_font_size)
-        run.font.color.rgb = title_color
-        run.font.bold = True
-        if font_name:
-            run.font.name = font_name
+        _apply_font(run, font_name or None, title_size, title_color, True)
 
     # 우측 상단: 체크박스
-    purposes = ["의사결정", "보고", "정보공유"]
-    parts = [f"{'☑' if p == purpose else '☐'} {p}" for p in purposes]
-    add_textbox(slide,
-        x=Inches(6.5), y=Inches(0.25), w=Inches(4.0), h=Inches(0.35),
+    parts = [f"{'☑' if p == purpose else '☐'} {p}" for p in _COVER_PURPOSES]
+    add_textbox(slide, *_COVER_PURPOSE_BOX,
         text="  ".join(parts), font_name=font_name, font_size=10,
-        color=RGBColor(0xFF, 0xFF, 0xFF), align=PP_ALIGN.RIGHT)
+        color=_WHITE, align=PP_ALIGN.RIGHT)
 
     # 날짜 (제목 아래 중간)
-    add_textbox(slide,
-        x=Inches(3.0), y=Inches(3.0), w=Inches(4.83), h=Inches(0.4),
+    add_textbox(slide, *_COVER_DATE_BOX,
         text=date, font_name=font_name, font_size=14,
-        color=RGBColor(0xFF, 0xFF, 0xFF), align=PP_ALIGN.CENTER)
+        color=_WHITE, align=PP_ALIGN.CENTER)
 
     # 하단 중앙: 부서 + 이름
-    add_textbox(slide,
-        x=Inches(2.0), y=Inches(5.8), w=Inches(6.83), h=Inches(0.4),
+    add_textbox(slide, *_COVER_AUTHOR_BOX,
         text=f"{department} {author}", font_name=font_name, font_size=12,
-        color=RGBColor(0xFF, 0xFF, 0xFF), align=PP_ALIGN.CENTER)
+        color=_WHITE, align=PP_ALIGN.CENTER)
 
     return slide